@@ -12,7 +12,7 @@ from abc import abstractmethod
 from collections import Counter
 from collections.abc import Iterable as IterableC
 from fractions import Fraction
-from itertools import chain, product, repeat
+from itertools import accumulate, chain, product, repeat
 from math import comb, gcd, sqrt
 from operator import (
     __abs__,
@@ -376,6 +376,7 @@ class H(_MappingT):
         "_hash",
         "_lowest_terms",
         "_order_stat_funcs_by_n",
+        "_roll_population_cum_counts",
         "_total",
     )
 
@@ -457,6 +458,9 @@ class H(_MappingT):
         # which Hs do not. So we basically do what functools.cached_property does, but
         # without a __dict__.
         self._order_stat_funcs_by_n: dict[int, Callable[[int], H]] = {}
+        self._roll_population_cum_counts: Optional[
+            tuple[tuple[RealLike, ...], tuple[int, ...]]
+        ] = None
 
     # ---- Overrides -------------------------------------------------------------------
 
@@ -1878,15 +1882,7 @@ class H(_MappingT):
         r"""
         Returns a (weighted) random outcome.
         """
-        return (
-            rng.RNG.choices(
-                population=tuple(self.outcomes()),
-                weights=tuple(self.counts()),
-                k=1,
-            )[0]
-            if self
-            else 0
-        )
+        return self._roll_n(1)[0]
 
     def _order_stat_func_for_n(self, n: int) -> Callable[[int], "H"]:
         betas_by_outcome: dict[RealLike, tuple[H, H]] = {}
@@ -1910,6 +1906,24 @@ class H(_MappingT):
 
         return order_stat_for_n_at_pos
 
+    def _roll_n(self, n: int) -> list[RealLike]:
+        # Drawing n outcomes at once consumes the RNG in exactly the same way as n
+        # separate calls to roll would
+        if not self:
+            return [0] * n
+
+        # Cumulative counts yield exactly the same draws as the equivalent weights (which
+        # choices would otherwise accumulate anew with every call)
+        if self._roll_population_cum_counts is None:
+            self._roll_population_cum_counts = (
+                tuple(self.outcomes()),
+                tuple(accumulate(self.counts())),
+            )
+
+        population, cum_counts = self._roll_population_cum_counts
+
+        return rng.RNG.choices(population=population, cum_weights=cum_counts, k=n)
+
 
 @runtime_checkable
 class HableT(Protocol, metaclass=CachingProtocolMeta):
@@ -10,7 +10,6 @@ import enum
 import warnings
 from abc import abstractmethod
 from collections import defaultdict, deque
-from copy import copy
 from itertools import chain
 from operator import (
     __abs__,
@@ -20,7 +19,6 @@ from operator import (
     __floordiv__,
     __ge__,
     __gt__,
-    __index__,
     __invert__,
     __le__,
     __lt__,
@@ -36,7 +34,6 @@ from operator import (
     __xor__,
     attrgetter,
 )
-from textwrap import indent
 from typing import (
     Any,
     Callable,
@@ -52,7 +49,7 @@ from numerary import RealLike
 from numerary.bt import beartype
 from numerary.types import SupportsIndex, SupportsInt
 
-from .h import H
+from .h import H, HableT
 from .lifecycle import experimental
 from .p import P
 from .types import (
@@ -63,6 +60,7 @@ from .types import (
     getitems,
     is_even,
     is_odd,
+    sorted_outcomes,
 )
 
 __all__ = ("R",)
@@ -116,7 +114,7 @@ class R:
     ValueRoller(value=H({1: 1, 2: 1, 3: 1, 4: 1, 5: 1, 6: 1}), annotation='')
     >>> ((4 * r_d6 + 3) ** 2 % 5).gt(2)
     BinarySumOpRoller(
-      bin_op=<function R.gt.<locals>._gt at ...>,
+      bin_op=<function _gt at ...>,
       left_source=BinarySumOpRoller(
           bin_op=<built-in function mod>,
           left_source=BinarySumOpRoller(
@@ -267,7 +265,7 @@ class R:
       -- END MONKEY PATCH -->
     """
 
-    __slots__: Any = ("_annotation", "_sources")
+    __slots__: Any = ("_annotation", "_hash", "_sources")
 
     # ---- Initializer -----------------------------------------------------------------
 
@@ -283,6 +281,7 @@ class R:
         super().__init__()
         self._sources = tuple(sources)
         self._annotation = annotation
+        self._hash: Optional[int] = None
 
     # ---- Overrides -------------------------------------------------------------------
 
@@ -295,9 +294,25 @@ class R:
 
     @beartype
     def __eq__(self, other) -> bool:
-        if isinstance(other, R):
+        if self is other:
+            return True
+        elif isinstance(other, R):
             return (
-                (isinstance(self, type(other)) or isinstance(other, type(self)))
+                (
+                    type(self) is type(other)
+                    or isinstance(self, type(other))
+                    or isinstance(other, type(self))
+                )
+                # Cheap rejection of unequal trees (by their arity, then by their hashes
+                # where both are already cached) before comparing them node-by-node.
+                # Hashes aren't computed here, since that would walk both trees once
+                # just to then walk them again when they turn out to be equal.
+                and len(self.sources) == len(other.sources)
+                and (
+                    self._hash is None
+                    or other._hash is None
+                    or self._hash == other._hash
+                )
                 and __eq__(self.sources, other.sources)  # order matters
                 and __eq__(self.annotation, other.annotation)
             )
@@ -311,6 +326,31 @@ class R:
         else:
             return super().__ne__(other)
 
+    @beartype
+    def __hash__(self) -> int:
+        # Rollers are immutable, so this part (which covers the entire tree of sources)
+        # is computed once and cached. Sub-classes extend this with the attributes they
+        # compare in __eq__. Neither annotations nor (custom) sources need be hashable,
+        # so those are only included where they are.
+        if self._hash is None:
+            self._hash = hash(
+                (_hash_or_zero(self.sources), _hash_or_zero(self.annotation))
+            )
+
+        return self._hash
+
+    def __getstate__(self) -> tuple[Optional[dict[str, Any]], dict[str, Any]]:
+        # Hashes (e.g., of strings) can differ between processes, so the cached one must
+        # not be pickled along with everything else
+        slot_state = {
+            slot_name: getattr(self, slot_name)
+            for slot_name in _slot_names(type(self))
+            if hasattr(self, slot_name)
+        }
+        slot_state["_hash"] = None
+
+        return getattr(self, "__dict__", None), slot_state
+
     @beartype
     def __add__(self, other: _ROperandT) -> "BinarySumOpRoller":
         try:
@@ -752,7 +792,7 @@ class R:
         [``from_sources_iterable``][dyce.r.R.from_sources_iterable] methods.
         """
         return cls.from_sources_iterable(
-            (cls.from_value(value) for value in values),
+            map(cls.from_value, values),
             annotation=annotation,
         )
 
@@ -845,7 +885,7 @@ class R:
         """
         return cls.filter_from_sources_iterable(
             predicate,
-            (cls.from_value(value) for value in values),
+            map(cls.from_value, values),
             annotation=annotation,
         )
 
@@ -936,7 +976,7 @@ class R:
         """
         return cls.select_from_sources_iterable(
             which,
-            (cls.from_value(value) for value in values),
+            map(cls.from_value, values),
             annotation=annotation,
         )
 
@@ -948,6 +988,13 @@ class R:
         for source in self.sources:
             yield source.roll()
 
+    def _roll_n(self, n: int) -> list["Roll"]:
+        # Sub-classes may override this where they can generate several independent
+        # rolls more cheaply than n calls to roll
+        roll = self.roll
+
+        return [roll() for _ in range(n)]
+
     @beartype
     def annotate(self, annotation: Any = "") -> "R":
         r"""
@@ -961,8 +1008,20 @@ class R:
 
         ```
         """
-        r = copy(self)
+        # This is equivalent to (but much cheaper than) copy.copy
+        r = type(self).__new__(type(self))
+
+        for slot_name in _slot_names(type(self)):
+            try:
+                setattr(r, slot_name, getattr(self, slot_name))
+            except AttributeError:
+                pass
+
+        if hasattr(self, "__dict__"):
+            r.__dict__.update(self.__dict__)
+
         r._annotation = annotation
+        r._hash = None
 
         return r
 
@@ -1073,10 +1132,6 @@ class R:
 
         See the [``map`` method][dyce.r.R.map].
         """
-
-        def _lt(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
-            return left_operand.lt(right_operand)
-
         return self.map(_lt, other)
 
     @beartype
@@ -1086,10 +1141,6 @@ class R:
 
         See the [``map`` method][dyce.r.R.map].
         """
-
-        def _le(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
-            return left_operand.le(right_operand)
-
         return self.map(_le, other)
 
     @beartype
@@ -1099,10 +1150,6 @@ class R:
 
         See the [``map`` method][dyce.r.R.map].
         """
-
-        def _eq(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
-            return left_operand.eq(right_operand)
-
         return self.map(_eq, other)
 
     @beartype
@@ -1112,10 +1159,6 @@ class R:
 
         See the [``map`` method][dyce.r.R.map].
         """
-
-        def _ne(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
-            return left_operand.ne(right_operand)
-
         return self.map(_ne, other)
 
     @beartype
@@ -1125,10 +1168,6 @@ class R:
 
         See the [``map`` method][dyce.r.R.map].
         """
-
-        def _gt(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
-            return left_operand.gt(right_operand)
-
         return self.map(_gt, other)
 
     @beartype
@@ -1138,10 +1177,6 @@ class R:
 
         See the [``map`` method][dyce.r.R.map].
         """
-
-        def _ge(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
-            return left_operand.ge(right_operand)
-
         return self.map(_ge, other)
 
     @beartype
@@ -1151,10 +1186,6 @@ class R:
 
         See the [``umap`` method][dyce.r.R.umap].
         """
-
-        def _is_even(operand: RollOutcome) -> RollOutcome:
-            return operand.is_even()
-
         return self.umap(_is_even)
 
     @beartype
@@ -1164,10 +1195,6 @@ class R:
 
         See the [``umap`` method][dyce.r.R.umap].
         """
-
-        def _is_odd(operand: RollOutcome) -> RollOutcome:
-            return operand.is_odd()
-
         return self.umap(_is_odd)
 
     @beartype
@@ -1220,7 +1247,7 @@ class ValueRoller(R):
     [``Roll`` objects][dyce.r.Roll], instead of other source rollers.
     """
 
-    __slots__: Any = ("_value",)
+    __slots__: Any = ("_homogeneous_pool", "_value")
 
     # ---- Initializer -----------------------------------------------------------------
 
@@ -1234,7 +1261,10 @@ class ValueRoller(R):
         r"Initializer."
         super().__init__(sources=(), annotation=annotation, **kw)
 
-        if isinstance(value, P) and not value.is_homogeneous():
+        # Kept so that batched rolls (see _roll_n) needn't check again
+        self._homogeneous_pool = isinstance(value, P) and value.is_homogeneous()
+
+        if isinstance(value, P) and not self._homogeneous_pool:
             warnings.warn(
                 f"using a heterogeneous pool ({value}) is not recommended where traceability is important",
                 stacklevel=2,
@@ -1248,6 +1278,26 @@ class ValueRoller(R):
     def __repr__(self) -> str:
         return f"{type(self).__name__}(value={self.value!r}, annotation={self.annotation!r})"
 
+    @beartype
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ValueRoller):
+            return bool(__eq__(self.value, other.value)) and super().__eq__(other)
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        # H objects compare equal to any HableT (e.g., P) with an equal h(), which can be
+        # far too costly to compute here, so all of those contribute alike
+        if isinstance(self.value, (H, HableT)):
+            value_hash = 0
+        else:
+            value_hash = _hash_or_zero(self.value)
+
+        return hash((super().__hash__(), value_hash))
+
     @beartype
     def roll(self) -> "Roll":
         r""""""
@@ -1258,10 +1308,44 @@ class ValueRoller(R):
             )
         elif isinstance(self.value, H):
             return Roll(self, roll_outcomes=(RollOutcome(self.value.roll()),))
-        elif isinstance(self.value, RealLike):
+        else:
+            # _ValueT admits only P, H, or RealLike, so the (comparatively costly) protocol
+            # check is a debug-only sanity check
+            assert isinstance(
+                self.value, RealLike
+            ), f"unrecognized value type {self.value!r}"
+
             return Roll(self, roll_outcomes=(RollOutcome(self.value),))
+
+    def _roll_n(self, n: int) -> list["Roll"]:
+        # Draw outcomes from histograms all at once (unless a sub-class has its own
+        # idea of how to roll). The resulting rolls are the same as those from n calls
+        # to roll.
+        if type(self).roll is not ValueRoller.roll:
+            return super()._roll_n(n)
+        elif isinstance(self.value, H):
+            return [
+                Roll(self, roll_outcomes=(RollOutcome(outcome),))
+                for outcome in self.value._roll_n(n)
+            ]
+        elif isinstance(self.value, P) and self._homogeneous_pool and self.value:
+            # P.roll draws once from each of its (here identical) histograms in turn,
+            # so consecutive runs of len(self.value) draws make up each roll
+            pool_len = len(self.value)
+            outcomes = self.value[0]._roll_n(n * pool_len)
+
+            return [
+                Roll(
+                    self,
+                    roll_outcomes=[
+                        RollOutcome(outcome)
+                        for outcome in sorted_outcomes(outcomes[i : i + pool_len])
+                    ],
+                )
+                for i in range(0, n * pool_len, pool_len)
+            ]
         else:
-            assert False, f"unrecognized value type {self.value!r}"
+            return super()._roll_n(n)
 
     # ---- Properties ------------------------------------------------------------------
 
@@ -1345,11 +1429,12 @@ class PoolRoller(R):
 
         return Roll(
             self,
-            roll_outcomes=(
+            roll_outcomes=[
                 roll_outcome
-                for roll_outcome in chain.from_iterable(source_rolls)
+                for source_roll in source_rolls
+                for roll_outcome in source_roll
                 if roll_outcome.value is not None
-            ),
+            ],
             source_rolls=source_rolls,
         )
 
@@ -1399,29 +1484,47 @@ class RepeatRoller(R):
 
         return f"""{type(self).__name__}(
   n={self.n!r},
-  source={indent(repr(source), "  ").strip()},
+  source={_source_repr(source)},
   annotation={self.annotation!r},
 )"""
 
     @beartype
     def __eq__(self, other) -> bool:
-        return super().__eq__(other) and self.n == other.n
+        if isinstance(other, RepeatRoller):
+            return self.n == other.n and super().__eq__(other)
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), self.n))
 
     @beartype
     def roll(self) -> "Roll":
         r""""""
-        source_rolls: list[Roll] = []
+        source_rolls: list[Roll]
 
-        for _ in range(self.n):
-            source_rolls.extend(self.source_rolls())
+        if type(self).source_rolls is R.source_rolls:
+            # Nothing overrides how sources are rolled, so let the sole source produce
+            # all n rolls at once
+            (source,) = self.sources
+            source_rolls = source._roll_n(self.n)
+        else:
+            source_rolls = []
+
+            for _ in range(self.n):
+                source_rolls.extend(self.source_rolls())
 
         return Roll(
             self,
-            roll_outcomes=(
+            roll_outcomes=[
                 roll_outcome
-                for roll_outcome in chain.from_iterable(source_rolls)
+                for source_roll in source_rolls
+                for roll_outcome in source_roll
                 if roll_outcome.value is not None
-            ),
+            ],
             source_rolls=source_rolls,
         )
 
@@ -1470,7 +1573,16 @@ class BasicOpRoller(R):
 
     @beartype
     def __eq__(self, other) -> bool:
-        return super().__eq__(other) and (_callable_cmp(self.op, other.op))
+        if isinstance(other, BasicOpRoller):
+            return _callable_cmp(self.op, other.op) and super().__eq__(other)
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), _callable_hash(self.op)))
 
     @beartype
     def roll(self) -> "Roll":
@@ -1478,11 +1590,12 @@ class BasicOpRoller(R):
         source_rolls = list(self.source_rolls())
         res = self.op(
             self,
-            (
+            [
                 roll_outcome
-                for roll_outcome in chain.from_iterable(source_rolls)
+                for source_roll in source_rolls
+                for roll_outcome in source_roll
                 if roll_outcome.value is not None
-            ),
+            ],
         )
 
         if isinstance(res, RollOutcome):
@@ -1516,15 +1629,9 @@ class NarySumOpRoller(BasicOpRoller):
     def roll(self) -> "Roll":
         r""""""
         source_rolls = list(self.source_rolls())
-
-        def _sum_roll_outcomes_by_rolls() -> Iterator[RollOutcome]:
-            for source_roll in source_rolls:
-                if len(source_roll) == 1 and source_roll[0].value is not None:
-                    yield from source_roll
-                else:
-                    yield RollOutcome(sum(source_roll.outcomes()), sources=source_roll)
-
-        res = self.op(self, _sum_roll_outcomes_by_rolls())
+        res = self.op(
+            self, (_sum_roll_outcome(source_roll) for source_roll in source_rolls)
+        )
 
         if isinstance(res, RollOutcome):
             roll_outcomes = (res,)
@@ -1582,9 +1689,6 @@ class BinarySumOpRoller(NarySumOpRoller):
 
     @beartype
     def __repr__(self) -> str:
-        def _source_repr(source: _SourceT) -> str:
-            return indent(repr(source), "  ").strip()
-
         left_source, right_source = self.sources
 
         return f"""{type(self).__name__}(
@@ -1596,7 +1700,32 @@ class BinarySumOpRoller(NarySumOpRoller):
 
     @beartype
     def __eq__(self, other) -> bool:
-        return super().__eq__(other) and (_callable_cmp(self.bin_op, other.bin_op))
+        if isinstance(other, BinarySumOpRoller):
+            return _callable_cmp(self.bin_op, other.bin_op) and super().__eq__(other)
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), _callable_hash(self.bin_op)))
+
+    @beartype
+    def roll(self) -> "Roll":
+        r""""""
+        # Same as NarySumOpRoller.roll, but straight-lined for exactly two sources
+        left_roll, right_roll = self.source_rolls()
+        res = self.bin_op(_sum_roll_outcome(left_roll), _sum_roll_outcome(right_roll))
+
+        if isinstance(res, RollOutcome):
+            roll_outcomes = (res,)
+        else:
+            roll_outcomes = res  # type: ignore [assignment]
+
+        return Roll(
+            self, roll_outcomes=roll_outcomes, source_rolls=(left_roll, right_roll)
+        )
 
 
 class UnarySumOpRoller(NarySumOpRoller):
@@ -1638,13 +1767,36 @@ class UnarySumOpRoller(NarySumOpRoller):
 
         return f"""{type(self).__name__}(
   un_op={self.un_op!r},
-  source={indent(repr(source), "  ").strip()},
+  source={_source_repr(source)},
   annotation={self.annotation!r},
 )"""
 
     @beartype
     def __eq__(self, other) -> bool:
-        return super().__eq__(other) and (_callable_cmp(self.un_op, other.un_op))
+        if isinstance(other, UnarySumOpRoller):
+            return _callable_cmp(self.un_op, other.un_op) and super().__eq__(other)
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), _callable_hash(self.un_op)))
+
+    @beartype
+    def roll(self) -> "Roll":
+        r""""""
+        # Same as NarySumOpRoller.roll, but straight-lined for exactly one source
+        (source_roll,) = self.source_rolls()
+        res = self.un_op(_sum_roll_outcome(source_roll))
+
+        if isinstance(res, RollOutcome):
+            roll_outcomes = (res,)
+        else:
+            roll_outcomes = res  # type: ignore [assignment]
+
+        return Roll(self, roll_outcomes=roll_outcomes, source_rolls=(source_roll,))
 
     # ---- Properties ------------------------------------------------------------------
 
@@ -1779,23 +1931,34 @@ class FilterRoller(R):
 
     @beartype
     def __eq__(self, other) -> bool:
-        return super().__eq__(other) and _callable_cmp(self.predicate, other.predicate)
+        if isinstance(other, FilterRoller):
+            return _callable_cmp(self.predicate, other.predicate) and super().__eq__(
+                other
+            )
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        return hash((super().__hash__(), _callable_hash(self.predicate)))
 
     @beartype
     def roll(self) -> "Roll":
         r""""""
         source_rolls = list(self.source_rolls())
-
-        def _filtered_roll_outcomes() -> Iterator[RollOutcome]:
-            for roll_outcome in chain.from_iterable(source_rolls):
-                if roll_outcome.value is not None:
-                    if self.predicate(roll_outcome):
-                        yield roll_outcome
-                    else:
-                        yield roll_outcome.euthanize()
+        predicate = self.predicate
 
         return Roll(
-            self, roll_outcomes=_filtered_roll_outcomes(), source_rolls=source_rolls
+            self,
+            roll_outcomes=[
+                roll_outcome if predicate(roll_outcome) else roll_outcome.euthanize()
+                for source_roll in source_rolls
+                for roll_outcome in source_roll
+                if roll_outcome.value is not None
+            ],
+            source_rolls=source_rolls,
         )
 
     # ---- Properties ------------------------------------------------------------------
@@ -1919,33 +2082,49 @@ class SelectionRoller(R):
 
     @beartype
     def __eq__(self, other) -> bool:
-        return super().__eq__(other) and self.which == other.which
+        if isinstance(other, SelectionRoller):
+            return self.which == other.which and super().__eq__(other)
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        # Slices are not hashable (before Python 3.12), so use their indexes instead
+        which_key = tuple(
+            (key.start, key.stop, key.step) if isinstance(key, slice) else key
+            for key in self.which
+        )
+
+        return hash((super().__hash__(), _hash_or_zero(which_key)))
 
     @beartype
     def roll(self) -> "Roll":
         r""""""
         source_rolls = list(self.source_rolls())
-        roll_outcomes = list(
+        roll_outcomes = [
             roll_outcome
-            for roll_outcome in chain.from_iterable(source_rolls)
+            for source_roll in source_rolls
+            for roll_outcome in source_roll
             if roll_outcome.value is not None
+        ]
+        roll_outcomes.sort(key=attrgetter("_value"))
+        all_indexes = range(len(roll_outcomes))
+        selected_indexes = list(getitems(all_indexes, self.which))
+        selected_index_set = set(selected_indexes)
+        selected_roll_outcomes = [
+            roll_outcomes[selected_index] for selected_index in selected_indexes
+        ]
+        selected_roll_outcomes.extend(
+            roll_outcomes[excluded_index].euthanize()
+            for excluded_index in all_indexes
+            if excluded_index not in selected_index_set
         )
-        roll_outcomes.sort(key=attrgetter("value"))
-        all_indexes = tuple(range(len(roll_outcomes)))
-        selected_indexes = tuple(getitems(all_indexes, self.which))
-
-        def _selected_roll_outcomes():
-            for selected_index in selected_indexes:
-                selected_roll_outcome = roll_outcomes[selected_index]
-                assert selected_roll_outcome.value is not None
-                yield selected_roll_outcome
-
-            for excluded_index in set(all_indexes) - set(selected_indexes):
-                yield roll_outcomes[excluded_index].euthanize()
 
         return Roll(
             self,
-            roll_outcomes=_selected_roll_outcomes(),
+            roll_outcomes=selected_roll_outcomes,
             source_rolls=source_rolls,
         )
 
@@ -2045,7 +2224,7 @@ class SubstitutionRoller(R):
 
         return f"""{type(self).__name__}(
   expansion_op={self.expansion_op!r},
-  source={indent(repr(source), "  ").strip()},
+  source={_source_repr(source)},
   coalesce_mode={self.coalesce_mode!r},
   max_depth={self.max_depth!r},
   annotation={self.annotation!r},
@@ -2053,11 +2232,27 @@ class SubstitutionRoller(R):
 
     @beartype
     def __eq__(self, other) -> bool:
-        return (
-            super().__eq__(other)
-            and _callable_cmp(self.expansion_op, other.expansion_op)
-            and self.coalesce_mode == other.coalesce_mode
-            and self.max_depth == other.max_depth
+        if isinstance(other, SubstitutionRoller):
+            return (
+                self.coalesce_mode == other.coalesce_mode
+                and self.max_depth == other.max_depth
+                and _callable_cmp(self.expansion_op, other.expansion_op)
+                and super().__eq__(other)
+            )
+        elif isinstance(other, R):
+            return False
+        else:
+            return super().__eq__(other)
+
+    @beartype
+    def __hash__(self) -> int:
+        return hash(
+            (
+                super().__hash__(),
+                _callable_hash(self.expansion_op),
+                self.coalesce_mode,
+                self.max_depth,
+            )
         )
 
     @beartype
@@ -2181,10 +2376,10 @@ class RollOutcome:
     def __lt__(self, other: _RollOutcomeOperandT) -> bool:  # type: ignore [has-type]
         if (
             isinstance(other, RollOutcome)
-            and self.value is not None
-            and other.value is not None
+            and self._value is not None
+            and other._value is not None
         ):
-            return bool(__lt__(self.value, other.value))
+            return bool(__lt__(self._value, other._value))
         else:
             return NotImplemented
 
@@ -2193,24 +2388,24 @@ class RollOutcome:
     def __le__(self, other: _RollOutcomeOperandT) -> bool:  # type: ignore [has-type]
         if (
             isinstance(other, RollOutcome)
-            and self.value is not None
-            and other.value is not None
+            and self._value is not None
+            and other._value is not None
         ):
-            return bool(__le__(self.value, other.value))
+            return bool(__le__(self._value, other._value))
         else:
             return NotImplemented
 
     @beartype
     def __eq__(self, other) -> bool:
         if isinstance(other, RollOutcome):
-            return bool(__eq__(self.value, other.value))
+            return bool(__eq__(self._value, other._value))
         else:
             return super().__eq__(other)
 
     @beartype
     def __ne__(self, other) -> bool:
         if isinstance(other, RollOutcome):
-            return bool(__ne__(self.value, other.value))
+            return bool(__ne__(self._value, other._value))
         else:
             return super().__ne__(other)
 
@@ -2218,10 +2413,10 @@ class RollOutcome:
     def __gt__(self, other: _RollOutcomeOperandT) -> bool:
         if (
             isinstance(other, RollOutcome)
-            and self.value is not None
-            and other.value is not None
+            and self._value is not None
+            and other._value is not None
         ):
-            return bool(__gt__(self.value, other.value))
+            return bool(__gt__(self._value, other._value))
         else:
             return NotImplemented
 
@@ -2229,10 +2424,10 @@ class RollOutcome:
     def __ge__(self, other: _RollOutcomeOperandT) -> bool:
         if (
             isinstance(other, RollOutcome)
-            and self.value is not None
-            and other.value is not None
+            and self._value is not None
+            and other._value is not None
         ):
-            return bool(__ge__(self.value, other.value))
+            return bool(__ge__(self._value, other._value))
         else:
             return NotImplemented
 
@@ -2759,7 +2954,7 @@ class Roll(Sequence[RollOutcome]):
     [``RollOutcome`` objects][dyce.r.RollOutcome] that can be assembled into trees.
     """
 
-    __slots__: Any = ("_r", "_roll_outcomes", "_source_rolls")
+    __slots__: Any = ("_outcomes", "_r", "_roll_outcomes", "_source_rolls", "_total")
 
     # ---- Initializer -----------------------------------------------------------------
 
@@ -2823,6 +3018,8 @@ class Roll(Sequence[RollOutcome]):
         self._r = r
         self._roll_outcomes = tuple(roll_outcomes)
         self._source_rolls = tuple(source_rolls)
+        self._outcomes: Optional[tuple[RealLike, ...]] = None
+        self._total: Optional[RealLike] = None
 
         for roll_outcome in self._roll_outcomes:
             if roll_outcome._roll is None:
@@ -2833,9 +3030,9 @@ class Roll(Sequence[RollOutcome]):
     @beartype
     def __repr__(self) -> str:
         return f"""{type(self).__name__}(
-  r={indent(repr(self.r), "  ").strip()},
-  roll_outcomes=({_seq_repr(self)}),
-  source_rolls=({_seq_repr(self.source_rolls)}),
+  r={_source_repr(self.r)},
+  roll_outcomes=({_seq_repr(self._roll_outcomes)}),
+  source_rolls=({_seq_repr(self._source_rolls)}),
 )"""
 
     @beartype
@@ -2853,14 +3050,12 @@ class Roll(Sequence[RollOutcome]):
         self,
         key: _GetItemT,
     ) -> Union[RollOutcome, tuple[RollOutcome, ...]]:
-        if isinstance(key, slice):
-            return self._roll_outcomes[key]
-        else:
-            return self._roll_outcomes[__index__(key)]
+        # Tuples already accept slices and anything implementing __index__
+        return self._roll_outcomes[key]
 
     @beartype
     def __iter__(self) -> Iterator[RollOutcome]:
-        yield from self._roll_outcomes
+        return iter(self._roll_outcomes)
 
     # ---- Properties ------------------------------------------------------------------
 
@@ -2901,8 +3096,11 @@ class Roll(Sequence[RollOutcome]):
         """
         return type(self)(
             self.r,
-            (roll_outcome.adopt(sources, coalesce_mode) for roll_outcome in self),
-            self.source_rolls,
+            (
+                roll_outcome.adopt(sources, coalesce_mode)
+                for roll_outcome in self._roll_outcomes
+            ),
+            self._source_rolls,
         )
 
     @beartype
@@ -2937,18 +3135,25 @@ class Roll(Sequence[RollOutcome]):
 
             ```
         """
-        return (
-            roll_outcome.value
-            for roll_outcome in self
-            if roll_outcome.value is not None
-        )
+        # Rolls are immutable, so this is only computed once (and only if needed)
+        if self._outcomes is None:
+            self._outcomes = tuple(
+                roll_outcome._value
+                for roll_outcome in self._roll_outcomes
+                if roll_outcome._value is not None
+            )
+
+        return iter(self._outcomes)
 
     @beartype
     def total(self) -> RealLike:
         r"""
         Shorthand for ``#!python sum(self.outcomes())``.
         """
-        return sum(self.outcomes())
+        if self._total is None:
+            self._total = sum(self.outcomes())
+
+        return self._total
 
 
 class RollWalkerVisitor:
@@ -3108,8 +3313,108 @@ def _callable_cmp(op1: Callable, op2: Callable) -> bool:
     )
 
 
+@beartype
+def _callable_hash(op: Callable) -> int:
+    # Consistent with _callable_cmp, which considers callables with the same code equal
+    return _hash_or_zero(getattr(op, "__code__", op))
+
+
+@beartype
+def _hash_or_zero(obj: object) -> int:
+    try:
+        return hash(obj)
+    except TypeError:
+        return 0
+
+
 @beartype
 def _seq_repr(s: Sequence) -> str:
-    seq_repr = indent(",\n".join(repr(i) for i in s), "    ")
+    seq_repr = ",\n".join([repr(i) for i in s])
+
+    return (
+        "\n    " + seq_repr.replace("\n", "\n    ") + ",\n  " if seq_repr else seq_repr
+    )
+
+
+def _slot_names(cls: type) -> list[str]:
+    # Cached on the class itself (as copyreg does, and under the same name, so the two
+    # stay compatible) rather than in a module-level cache that would keep classes alive
+    slot_names = cls.__dict__.get("__slotnames__")
+
+    if slot_names is not None:
+        return slot_names
+
+    slot_names = []
+
+    for c in cls.__mro__:
+        slots = c.__dict__.get("__slots__", ())
+
+        if isinstance(slots, str):
+            slots = (slots,)
+
+        for slot_name in slots:
+            if slot_name in ("__dict__", "__weakref__"):
+                continue
+            elif slot_name.startswith("__") and not slot_name.endswith("__"):
+                # Private names are mangled
+                slot_name = f"_{c.__name__.lstrip('_')}{slot_name}"
+
+            slot_names.append(slot_name)
+
+    setattr(cls, "__slotnames__", slot_names)
+
+    return slot_names
+
+
+@beartype
+def _source_repr(source: object) -> str:
+    return repr(source).strip().replace("\n", "\n  ")
+
+
+@beartype
+def _sum_roll_outcome(roll: Roll) -> RollOutcome:
+    # A roll with a single (non-excluded) outcome stands in for its own sum
+    if len(roll) == 1 and roll[0].value is not None:
+        return roll[0]
+    else:
+        return RollOutcome(roll.total(), sources=roll)
+
 
-    return "\n" + seq_repr + ",\n  " if seq_repr else seq_repr
+@beartype
+def _lt(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
+    return left_operand.lt(right_operand)
+
+
+@beartype
+def _le(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
+    return left_operand.le(right_operand)
+
+
+@beartype
+def _eq(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
+    return left_operand.eq(right_operand)
+
+
+@beartype
+def _ne(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
+    return left_operand.ne(right_operand)
+
+
+@beartype
+def _gt(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
+    return left_operand.gt(right_operand)
+
+
+@beartype
+def _ge(left_operand: RollOutcome, right_operand: RollOutcome) -> RollOutcome:
+    return left_operand.ge(right_operand)
+
+
+@beartype
+def _is_even(operand: RollOutcome) -> RollOutcome:
+    return operand.is_even()
+
+
+@beartype
+def _is_odd(operand: RollOutcome) -> RollOutcome:
+    return operand.is_odd()
@@ -39,6 +39,9 @@ def as_int(val: SupportsInt) -> int:
     Helper function to losslessly coerce *val* into an ``#!python int``. Raises
     ``#!python TypeError`` if that cannot be done.
     """
+    if type(val) is int:
+        return val
+
     int_val = int(val)
 
     if int_val != val:
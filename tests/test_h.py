@@ -13,12 +13,14 @@ import os
 import statistics
 from decimal import Decimal
 from fractions import Fraction
+from random import Random
 from typing import Type, Union
+from unittest.mock import patch
 
 import pytest
 from numerary import RealLike
 
-from dyce import H
+from dyce import H, rng
 from dyce.evaluation import explode
 from dyce.h import _within
 
@@ -571,6 +573,22 @@ class TestH:
     def test_roll(self) -> None:
         d6 = H(6)
         assert all(d6.roll() in d6 for _ in range(100))
+        assert H({}).roll() == 0
+
+    def test_roll_weights(self) -> None:
+        h = H({-1: 1, 0: 0, 1: 3, 2: 6})
+        outcomes = tuple(h.outcomes())
+        weights = tuple(h.counts())
+        seed = 1633056410
+
+        with patch.object(rng, "RNG", Random(seed)):
+            rolls = tuple(h.roll() for _ in range(100))
+
+        expected = tuple(
+            Random(seed).choices(population=outcomes, weights=weights, k=100)
+        )
+        assert rolls == expected
+        assert 0 not in rolls
 
 
 def test_within() -> None:
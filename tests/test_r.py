@@ -7,14 +7,25 @@
 # ======================================================================================
 
 import operator
+import pickle
 import re
+import warnings
+from random import Random
+from typing import Iterator
+from unittest.mock import patch
 
-from dyce import H, P, R
+from dyce import H, P, R, rng
 from dyce.r import (
+    BinarySumOpRoller,
     CoalesceMode,
+    FilterRoller,
     PoolRoller,
+    RepeatRoller,
+    Roll,
     RollOutcome,
+    SelectionRoller,
     SubstitutionRoller,
+    UnarySumOpRoller,
     ValueRoller,
 )
 
@@ -71,6 +82,64 @@ class TestValueRoller:
         assert r_42 != -r_42
         assert -r_42 == -r_42
         assert -r_42 != R.from_value(-42)
+        assert r_42 != R.from_value(43)
+        assert R.from_value(H(6)) == R.from_value(H(6))
+        assert R.from_value(H(6)) != R.from_value(H(8))
+
+    def test_annotate(self) -> None:
+        class _DictValueRoller(ValueRoller):
+            pass
+
+        r_d6 = _DictValueRoller(H(6), annotation="d6")
+        r_d6.extra = "extra"  # type: ignore [attr-defined]
+        r_d6_annotated = r_d6.annotate("annotated")
+        assert isinstance(r_d6_annotated, _DictValueRoller)
+        assert r_d6_annotated.value == H(6)
+        assert r_d6_annotated.annotation == "annotated"
+        assert r_d6_annotated.extra == "extra"  # type: ignore [attr-defined]
+        assert r_d6.annotation == "d6"
+        assert hash(r_d6) != hash(r_d6_annotated)
+        assert r_d6_annotated.annotate("d6") == r_d6
+
+    def test_hash(self) -> None:
+        r_d6 = R.from_value(H(6), annotation="d6")
+        assert hash(r_d6) == hash(R.from_value(H(6), annotation="d6"))
+        assert hash(r_d6.annotate("")) == hash(R.from_value(H(6)))
+        assert hash(R.from_value(3 @ P(6), annotation=[])) == hash(
+            R.from_value(3 @ P(6), annotation=[])
+        )
+        assert len({r_d6, R.from_value(H(6), annotation="d6"), r_d6.annotate("")}) == 2
+
+        def _r_tree() -> R:
+            return (2 @ r_d6 + r_d6.lt(4)).select(slice(None, 1)).filter(bool)
+
+        assert _r_tree() == _r_tree()
+        assert hash(_r_tree()) == hash(_r_tree())
+
+    def test_hash_hable(self) -> None:
+        r_h_d6 = R.from_value(H(6))
+        r_p_d6 = R.from_value(P(6))
+        assert r_h_d6 == r_p_d6
+        assert hash(r_h_d6) == hash(r_p_d6)
+        assert r_h_d6 + 3 == r_p_d6 + 3
+        assert hash(r_h_d6 + 3) == hash(r_p_d6 + 3)
+        assert R.from_value(H(6)) != R.from_value(2 @ P(6))
+
+    def test_hash_pool_without_h(self) -> None:
+        p = P(*([H(100)] * 20), H(99))
+
+        with patch.object(P, "h", side_effect=AssertionError("h() called")):
+            assert hash(R.from_value(p)) == hash(R.from_value(p))
+            assert R.from_value(p) + 1 == R.from_value(p) + 1
+
+    def test_pickle_round_trip(self) -> None:
+        r_pool = R.from_values(1, 2, annotation="pool")
+        hash(r_pool)
+        # Stand in for a hash cached in a process with a different PYTHONHASHSEED
+        r_pool._hash = ~r_pool._hash  # type: ignore [operator]
+        r_pool_unpickled = pickle.loads(pickle.dumps(r_pool))
+        assert r_pool_unpickled._hash is None
+        assert r_pool_unpickled == R.from_values(1, 2, annotation="pool")
 
     def test_roll(self) -> None:
         for o_type in _OUTCOME_TYPES:
@@ -114,6 +183,9 @@ class TestRepeatRoller:
         assert 3 @ r_42 == 3 @ r_42
         assert 3 @ r_42 != 3 @ r_42_annotated
         assert 3 @ r_42_annotated == 3 @ r_42.annotate("42")
+        assert 3 @ r_42 != r_42
+        assert 3 @ r_42 != 3
+        assert 3 @ r_42 != 4 @ r_42
 
     def test_roll(self) -> None:
         for o_type in _OUTCOME_TYPES:
@@ -127,6 +199,48 @@ class TestRepeatRoller:
                 for outcome in r_100_roll.outcomes():
                     assert outcome in h, r_100_roll
 
+    def test_roll_batched(self) -> None:
+        class _UnbatchedValueRoller(ValueRoller):
+            __slots__ = ()
+
+            def roll(self) -> Roll:
+                return super().roll()
+
+        for value in (H(6), H({}), 3 @ P(6), P(H({1: 1, 2: 1}), H({2: 1, 1: 1})), P()):
+            rolls = []
+
+            for value_roller_type in (ValueRoller, _UnbatchedValueRoller):
+                with patch.object(rng, "RNG", Random(1633056410)):
+                    r_100 = 100 @ value_roller_type(value)
+                    r_100_roll = r_100.roll()
+                    assert len(r_100_roll.source_rolls) == 100
+
+                    for source_roll in r_100_roll.source_rolls:
+                        assert source_roll.r is r_100.sources[0]
+
+                    rolls.append(tuple(r_100_roll.outcomes()))
+
+            assert rolls[0] == rolls[1]
+
+    def test_roll_batched_pool_no_warning(self) -> None:
+        r_100 = 100 @ R.from_value(3 @ P(6))
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            r_100.roll()
+
+        assert not [w for w in caught if "is_homogeneous" in str(w.message)]
+
+    def test_roll_source_rolls_override(self) -> None:
+        class _ConstantRepeatRoller(RepeatRoller):
+            __slots__ = ()
+
+            def source_rolls(self) -> Iterator[Roll]:
+                yield R.from_value(1).roll()
+
+        r = _ConstantRepeatRoller(5, R.from_value(H(6)))
+        assert tuple(r.roll().outcomes()) == (1,) * 5
+
 
 class TestBinarySumOpRoller:
     def test_repr(self) -> None:
@@ -459,6 +573,19 @@ class TestBinarySumOpRoller:
                     assert roll_outcome.value in h_mul_o
                     assert r_mul_o_roll.total() in h_mul_o, r_mul_o
 
+    def test_roll_source_rolls_override(self) -> None:
+        class _ConstantBinarySumOpRoller(BinarySumOpRoller):
+            __slots__ = ()
+
+            def source_rolls(self) -> Iterator[Roll]:
+                yield R.from_value(1).roll()
+                yield R.from_value(2).roll()
+
+        r = _ConstantBinarySumOpRoller(
+            operator.__sub__, R.from_value(H(6)), R.from_value(H(6))
+        )
+        assert tuple(r.roll().outcomes()) == (-1,)
+
 
 class TestUnarySumOpRoller:
     def test_repr(self) -> None:
@@ -576,6 +703,16 @@ class TestUnarySumOpRoller:
                 assert roll_outcome.r == r_neg
                 assert r_neg_roll.total() in h_neg, r_neg
 
+    def test_roll_source_rolls_override(self) -> None:
+        class _ConstantUnarySumOpRoller(UnarySumOpRoller):
+            __slots__ = ()
+
+            def source_rolls(self) -> Iterator[Roll]:
+                yield R.from_value(1).roll()
+
+        r = _ConstantUnarySumOpRoller(operator.__neg__, R.from_value(H(6)))
+        assert tuple(r.roll().outcomes()) == (-1,)
+
 
 class TestPoolRoller:
     def test_repr(self) -> None:
@@ -639,6 +776,16 @@ class TestPoolRoller:
 
                 assert r_3_roll.total() in h_3, r_3_roll
 
+    def test_roll_source_rolls_override(self) -> None:
+        class _ConstantPoolRoller(PoolRoller):
+            __slots__ = ()
+
+            def source_rolls(self) -> Iterator[Roll]:
+                yield R.from_value(1).roll()
+
+        r = _ConstantPoolRoller((R.from_value(H(6)), R.from_value(H(6))))
+        assert tuple(r.roll().outcomes()) == (1,)
+
 
 class TestFilterRoller:
     def test_repr(self) -> None:
@@ -703,6 +850,16 @@ class TestFilterRoller:
             else:
                 assert roll_outcome.r in r_squares.sources
 
+    def test_roll_source_rolls_override(self) -> None:
+        class _ConstantFilterRoller(FilterRoller):
+            __slots__ = ()
+
+            def source_rolls(self) -> Iterator[Roll]:
+                yield R.from_value(1).roll()
+
+        r = _ConstantFilterRoller(bool, (R.from_value(H(6)), R.from_value(H(6))))
+        assert tuple(r.roll().outcomes()) == (1,)
+
 
 class TestSelectionRoller:
     def test_repr(self) -> None:
@@ -749,6 +906,18 @@ class TestSelectionRoller:
             else:
                 assert roll_outcome.r in r_squares.sources
 
+    def test_roll_source_rolls_override(self) -> None:
+        class _ConstantSelectionRoller(SelectionRoller):
+            __slots__ = ()
+
+            def source_rolls(self) -> Iterator[Roll]:
+                yield R.from_value(1).roll()
+
+        r = _ConstantSelectionRoller(
+            (slice(None),), (R.from_value(H(6)), R.from_value(H(6)))
+        )
+        assert tuple(r.roll().outcomes()) == (1,)
+
 
 class TestSubstitutionRoller:
     def test_repr(self) -> None:
@@ -933,6 +1102,28 @@ class TestRoll:
             (_, r_d6_ro) = r_d6_mul2_ro.sources
             assert r_d6_ro.r == r_d6
 
+    def test_slots(self) -> None:
+        d6 = H(6)
+        r_d6 = R.from_value(d6)
+        rs = (
+            r_d6,
+            3 @ r_d6,
+            r_d6 + r_d6,
+            -r_d6,
+            R.from_values(d6, d6),
+            R.filter_from_values(bool, d6, d6),
+            R.select_from_values((0,), d6, d6),
+            SubstitutionRoller(lambda outcome: outcome, r_d6),
+        )
+
+        for r in rs:
+            roll = r.roll()
+            assert not hasattr(r, "__dict__"), r
+            assert not hasattr(roll, "__dict__"), roll
+
+            for roll_outcome in roll:
+                assert not hasattr(roll_outcome, "__dict__"), roll_outcome
+
 
 class TestRollOutcome:
     def test_is_even(self) -> None: